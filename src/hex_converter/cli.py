@@ -2,31 +2,19 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import sys
 from typing import Iterable, List, Sequence
 
-try:
-    # Prefer package's own version constant if you export it in __init__.py
-    from . import __version__  # type: ignore[attr-defined]
-except Exception:
-    # Fallback to installed distribution metadata
-    try:
-        from importlib.metadata import version as _dist_version, PackageNotFoundError
-        try:
-            __version__ = _dist_version("hex-converter")
-        except PackageNotFoundError:
-            __version__ = "0.0.0+dev"
-    except Exception:  # very old Python
-        __version__ = "0.0.0+dev"
-
+from .__about__ import __version__
 from .logic import (
+    BIN8,
     MAX_BYTES,
     parse_hex_bytes,
     parse_int_maybe,
     parse_groups_pattern,
     group_bytes_by_sizes,
-    group_bytes_into_hex,
-    group_bytes_into_hex_custom,
+    group_bytes_to_ints,
     bytes_to_ascii_runs,
     int_to_bytes,
     bytes_to_int,
@@ -34,24 +22,35 @@ from .logic import (
     bytes_to_sign_magnitude,
 )
 
+# Cached codec entry point for cmd_string (skips the registry lookup per call)
+_latin1_encode = codecs.getencoder("latin-1")
+
+# --repr choice -> int_to_bytes representation mode
+_REPR_MODES = {
+    "unsigned": "Unsigned",
+    "twos": "Signed (2's complement)",
+    "ones": "Signed (1's complement)",
+    "signmag": "Signed (Sign-magnitude)",
+}
+
+# All-ones masks indexed by byte width (0..MAX_BYTES)
+_MASKS = tuple((1 << (w * 8)) - 1 for w in range(MAX_BYTES + 1))
+
 
 # ---------- helpers ----------
-def _print_kv(key: str, value: str | Iterable[str]) -> None:
-    if isinstance(value, (list, tuple)):
-        print(f"{key}: {' '.join(str(v) for v in value)}")
-    else:
-        print(f"{key}: {value}")
+def _print_kv(out: list[str], key: str, value: str) -> None:
+    out.append(f"{key}: {value}\n")
 
-def _as_bin_per_byte(data: bytes) -> list[str]:
-    return [f"{b:08b}" for b in data]
+def _print_seq(out: list[str], key: str, values: Iterable[object]) -> None:
+    out.append(f"{key}: {' '.join(map(str, values))}\n")
 
-def _apply_grouping_hex(data: bytes, group: str, groups_pattern: str, endian: str) -> list[str]:
-    if group == "custom":
-        sizes = parse_groups_pattern(groups_pattern)
-        return group_bytes_into_hex_custom(data, sizes, endian)
-    else:
-        g = int(group)
-        return group_bytes_into_hex(data, g, endian)
+def _write_output(out: list[str]) -> None:
+    """Write a command's buffered lines to stdout in one call."""
+    if out:
+        sys.stdout.write("".join(out))
+
+def _as_bin_per_byte(data: bytes) -> list[str]:
+    return list(map(BIN8.__getitem__, data))
 
 def _chunks_for_grouping(data: bytes, group: str, groups_pattern: str, endian: str) -> list[bytes]:
     if group == "custom":
@@ -64,40 +63,65 @@ def _chunks_for_grouping(data: bytes, group: str, groups_pattern: str, endian: s
         chunks = [ch[::-1] for ch in chunks]
     return chunks
 
+def _twos_from_unsigned(u: int, width: int) -> int:
+    """Reinterpret an unsigned ``width``-byte value as 2's complement."""
+    bits = 8 * width
+    return u - (1 << bits) if u >> (bits - 1) else u
+
+def _read_stdin() -> str:
+    """
+    Read all of stdin for hex input. Reads the binary buffer when available
+    and decodes it once with stdin's own encoding and errors handler, so the
+    text matches a text-mode read apart from newline translation (the hex
+    parser treats CR as whitespace either way).
+    """
+    stdin = sys.stdin
+    buf = getattr(stdin, "buffer", None)
+    if buf is None:
+        return stdin.read()
+    return buf.read().decode(stdin.encoding or "utf-8", stdin.errors or "strict")
+
 
 # ---------- subcommands ----------
 def cmd_hex(args: argparse.Namespace) -> int:
     # Input
-    src = args.hex if args.hex is not None else sys.stdin.read()
+    src = args.hex if args.hex is not None else _read_stdin()
     data = parse_hex_bytes(src)
 
-    # Bytes (raw)
-    _print_kv("Bytes", " ".join(f"{b:02X}" for b in data))
-    _print_kv("Binary", _as_bin_per_byte(data))
-
-    # Grouped hex (endianness applied within each group like the GUI)
-    groups_hex = _apply_grouping_hex(data, args.group, args.groups, args.endian)
-    if groups_hex:
-        _print_kv("Hex groups", groups_hex)
-
-    # Integers per group (if groups exist)
-    chunks = _chunks_for_grouping(data, args.group, args.groups, args.endian)
-    if chunks:
-        unsigned = [int.from_bytes(ch, byteorder="big", signed=False) for ch in chunks]
-        twos    = [int.from_bytes(ch, byteorder="big", signed=True)  for ch in chunks]
-        _print_kv("Unsigned", [str(u) for u in unsigned])
-        _print_kv("Signed 2's", [str(s) for s in twos])
-
-    # Whole-buffer “other signed” interpretations (match GUI)
-    _print_kv("Signed 1's (whole)", str(bytes_to_ones_complement(data)))
-    _print_kv("Sign-magnitude (whole)", str(bytes_to_sign_magnitude(data)))
-
-    # ASCII runs
-    runs = bytes_to_ascii_runs(data)
-    if runs:
-        _print_kv("ASCII", "".join(runs))
-
-    _print_kv("Length", str(len(data)))
+    out: list[str] = []
+    try:
+        # Bytes (raw)
+        _print_kv(out, "Bytes", data.hex(" ").upper())
+        _print_seq(out, "Binary", _as_bin_per_byte(data))
+
+        # Grouped hex (endianness applied within each group like the GUI)
+        chunks = _chunks_for_grouping(data, args.group, args.groups, args.endian)
+        groups_hex = [ch.hex(" ").upper() for ch in chunks]
+        if groups_hex:
+            _print_seq(out, "Hex groups", groups_hex)
+
+        # Integers per group (if groups exist)
+        if args.group == "custom":
+            unsigned = [int.from_bytes(ch, byteorder="big", signed=False) for ch in chunks]
+            twos = [_twos_from_unsigned(u, len(ch)) for u, ch in zip(unsigned, chunks)]
+        else:
+            unsigned, twos = group_bytes_to_ints(data, endian=args.endian, group_size=int(args.group))
+        if unsigned:
+            _print_seq(out, "Unsigned", unsigned)
+            _print_seq(out, "Signed 2's", twos)
+
+        # Whole-buffer “other signed” interpretations (match GUI)
+        _print_kv(out, "Signed 1's (whole)", str(bytes_to_ones_complement(data)))
+        _print_kv(out, "Sign-magnitude (whole)", str(bytes_to_sign_magnitude(data)))
+
+        # ASCII runs
+        text = "".join(bytes_to_ascii_runs(data))
+        if text:
+            _print_kv(out, "ASCII", text)
+
+        _print_kv(out, "Length", str(len(data)))
+    finally:
+        _write_output(out)
     return 0
 
 
@@ -106,49 +130,52 @@ def cmd_number(args: argparse.Namespace) -> int:
     width = max(1, min(args.width, MAX_BYTES))
 
     # Convert number → bytes (according to representation + endianness)
-    mode = {
-        "unsigned": "Unsigned",
-        "twos": "Signed (2's complement)",
-        "ones": "Signed (1's complement)",
-        "signmag": "Signed (Sign-magnitude)",
-    }[args.repr]
+    mode = _REPR_MODES[args.repr]
 
     data = int_to_bytes(val, width, mode, args.endian)
 
-    # Bytes view
-    _print_kv("Bytes", " ".join(f"{b:02X}" for b in data))
-    _print_kv("Binary", _as_bin_per_byte(data))
-
-    # ASCII runs
-    runs = bytes_to_ascii_runs(data)
-    if runs:
-        _print_kv("ASCII", "".join(runs))
-
-    # Scalars
-    masked = val & ((1 << (width * 8)) - 1)
-    _print_kv("Scalar hex", hex(masked))
-    _print_kv("Scalar dec", str(val))
+    out: list[str] = []
+    try:
+        # Bytes view
+        _print_kv(out, "Bytes", data.hex(" ").upper())
+        _print_seq(out, "Binary", _as_bin_per_byte(data))
+
+        # ASCII runs
+        text = "".join(bytes_to_ascii_runs(data))
+        if text:
+            _print_kv(out, "ASCII", text)
+
+        # Scalars
+        masked = val & _MASKS[width]
+        _print_kv(out, "Scalar hex", hex(masked))
+        _print_kv(out, "Scalar dec", str(val))
+    finally:
+        _write_output(out)
     return 0
 
 
 def cmd_string(args: argparse.Namespace) -> int:
     # Encode as latin-1 (matches GUI behavior)
-    raw = args.text.encode("latin-1", errors="replace")
-
-    # Per-byte views
-    _print_kv("Bytes", " ".join(f"{b:02X}" for b in raw))
-    _print_kv("Binary", _as_bin_per_byte(raw))
-    _print_kv("ASCII", args.text)  # original text
-
-    # Grouped views (endianness applied inside each group)
-    chunks = _chunks_for_grouping(raw, args.group, args.groups, args.endian)
-    if chunks:
-        hex_groups = [" ".join(f"{b:02X}" for b in ch) for ch in chunks]
-        bin_groups = [" ".join(f"{b:08b}" for b in ch) for ch in chunks]
-        text_groups = ["".join(bytes_to_ascii_runs(ch)) for ch in chunks]
-        _print_kv("Hex groups", hex_groups)
-        _print_kv("Bin groups", bin_groups)
-        _print_kv("Text groups", text_groups)
+    raw, _ = _latin1_encode(args.text, "replace")
+
+    out: list[str] = []
+    try:
+        # Per-byte views
+        _print_kv(out, "Bytes", raw.hex(" ").upper())
+        _print_seq(out, "Binary", _as_bin_per_byte(raw))
+        _print_kv(out, "ASCII", args.text)  # original text
+
+        # Grouped views (endianness applied inside each group)
+        chunks = _chunks_for_grouping(raw, args.group, args.groups, args.endian)
+        if chunks:
+            hex_groups = [ch.hex(" ").upper() for ch in chunks]
+            bin_groups = [" ".join(map(BIN8.__getitem__, ch)) for ch in chunks]
+            text_groups = ["".join(bytes_to_ascii_runs(ch)) for ch in chunks]
+            _print_seq(out, "Hex groups", hex_groups)
+            _print_seq(out, "Bin groups", bin_groups)
+            _print_seq(out, "Text groups", text_groups)
+    finally:
+        _write_output(out)
     return 0
 
 
@@ -167,22 +194,13 @@ def _add_grouping_args(p: argparse.ArgumentParser) -> None:
         help='custom pattern for --group=custom, e.g. "1,1,6"'
     )
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        prog="hex-converter",
-        description="Hex Bytes ⇆ Integer/Text Converter (CLI)"
-    )
-    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-
-    sp = p.add_subparsers(dest="cmd")
-
-    # hex
+def _add_hex_parser(sp) -> None:
     ph = sp.add_parser("hex", help="inspect a sequence of hex bytes")
     ph.add_argument("hex", nargs="?", help="hex like 'E8 08 B0 04' or 'E808B004'")
     _add_grouping_args(ph)
     ph.set_defaults(func=cmd_hex)
 
-    # number
+def _add_number_parser(sp) -> None:
     pn = sp.add_parser("number", help="convert number → bytes and views")
     pn.add_argument("value", help="number (dec or 0x… / 0b… / 0o…)")
     pn.add_argument("--width", type=int, default=4, help=f"bytes width (1..{MAX_BYTES}, default: 4)")
@@ -195,17 +213,44 @@ def build_parser() -> argparse.ArgumentParser:
     pn.add_argument("--endian", choices=("little", "big"), default="little")
     pn.set_defaults(func=cmd_number)
 
-    # string
+def _add_string_parser(sp) -> None:
     ps = sp.add_parser("string", help="inspect a text string as bytes")
     ps.add_argument("text", help="text to inspect (latin-1)")
     _add_grouping_args(ps)
     ps.set_defaults(func=cmd_string)
 
+# Subcommand name -> builder, in help order
+_SUBCOMMANDS = {
+    "hex": _add_hex_parser,
+    "number": _add_number_parser,
+    "string": _add_string_parser,
+}
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser. With ``only`` set to a subcommand name, just that
+    subparser is constructed (the others are not needed to parse its args).
+    """
+    p = argparse.ArgumentParser(
+        prog="hex-converter",
+        description="Hex Bytes ⇆ Integer/Text Converter (CLI)"
+    )
+    p.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+
+    sp = p.add_subparsers(dest="cmd")
+    if only in _SUBCOMMANDS:
+        _SUBCOMMANDS[only](sp)
+    else:
+        for add_subparser in _SUBCOMMANDS.values():
+            add_subparser(sp)
+
     return p
 
 
 def main(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Only build the subparser being invoked; anything else gets the full parser
+    parser = build_parser(only=argv[0] if argv else None)
     args = parser.parse_args(argv)
 
     if not getattr(args, "cmd", None):
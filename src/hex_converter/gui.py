@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import sys
 import tkinter as tk
 from tkinter import ttk
-from functools import partial
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 from .gui_menu import (
     MENU_SPEC,
@@ -15,6 +17,8 @@ from .gui_menu import (
     show_shortcuts_dialog,
 )
 from .logic import (
+    BIN8,
+    HEX2,
     MAX_BYTES,
     bytes_to_ascii_runs,
     bytes_to_int,
@@ -23,8 +27,9 @@ from .logic import (
     parse_hex_bytes,
     parse_groups_pattern,
     parse_int_maybe,
-    int_range_for,
+    range_for_mode,
     int_to_bytes,
+    group_bytes_by_sizes,
     group_bytes_into_hex,
     group_bytes_into_hex_custom,
     group_bytes_to_ints,
@@ -33,82 +38,144 @@ from .logic import (
 )
 
 
+def _set_if_changed(var: tk.Variable, value) -> None:
+    """Write `value` unless `var` already holds it (Tk notifies traces on every set)."""
+    if var.get() != value:
+        var.set(value)
+
+
+@lru_cache(maxsize=None)
+def _range_label(width: int, mode: str) -> str:
+    """Valid-range text for a byte width and representation (MAX_BYTES x 4 entries at most)."""
+    lo, hi = range_for_mode(width, mode)
+    return f"Valid range: {lo:,} to {hi:,}"
+
+
 class BitToggleField(ttk.Frame):
-    """Render checkboxes for each bit of a byte sequence (in given order)."""
+    """Render a clickable cell for each bit of a byte sequence (in given order).
+
+    All rows are drawn on a single Canvas, so Tk manages one widget instead
+    of a label plus eight checkbuttons per byte.
+    """
+    # Cell geometry (pixels) and look
+    _CELL_W = 18
+    _ROW_H = 20
+    _LABEL_PAD = 6
+    _FONT = ("TkFixedFont", 10)
+    _ON_FILL, _ON_TEXT = "#3b78c4", "#ffffff"
+    _OFF_FILL, _OFF_TEXT = "#ffffff", "#000000"
+    _OUTLINE = "#a0a0a0"
+    # Pixel width of the "Byte NN:" label; measured once per process (same font everywhere)
+    _CACHED_LABEL_W: int | None = None
+
     def __init__(self, parent, on_bits_changed):
         super().__init__(parent)
-        self._vars: list[tuple[int, int, tk.IntVar]] = []  # (byte_index, bit, var)
         self._on_bits_changed = on_bits_changed
+        self._data = bytearray()  # bytes currently shown (display order)
+        # Pooled canvas items per byte: (label, [(rect, text) MSB..LSB]); the first `_visible` are shown
+        self._rows: list[tuple[int, list[tuple[int, int]]]] = []
+        self._visible = 0
 
-    def set_bits(self, data: bytes) -> None:
-        """Rebuild the UI for the given bytes (display order: MSB..LSB)."""
-        # Nuke previous
-        for w in self.winfo_children():
-            w.destroy()
-        self._vars.clear()
-
-        if not data:
-            return
+        self._canvas = tk.Canvas(self, width=0, height=0, highlightthickness=0, borderwidth=0)
+        try:
+            bg = ttk.Style(self).lookup("TFrame", "background")
+            if bg:
+                self._canvas.configure(background=bg)
+        except tk.TclError:
+            pass
+        self._canvas.grid(row=0, column=0, sticky="w")
+        self._canvas.tag_bind("bit", "<Button-1>", self._on_click)
+
+    def _build_row(self, byte_index: int) -> tuple[int, list[tuple[int, int]]]:
+        """Draw one row: [Label][b7][b6][b5][b4][b3][b2][b1][b0]."""
+        c = self._canvas
+        top = byte_index * self._ROW_H
+        mid = top + self._ROW_H // 2
+        row_tag = f"row:{byte_index}"
+
+        label = c.create_text(
+            0, mid, text=f"Byte {byte_index:02d}:", anchor="w", font=self._FONT, tags=(row_tag,)
+        )
 
-        # Build one grid row per byte: [Label][b7][b6][b5][b4][b3][b2][b1][b0]
-        for byte_index, b in enumerate(data):
-            row = ttk.Frame(self)
-            row.grid(row=byte_index, column=0, sticky="w", pady=(0, 2))
-
-            # Fixed-width label so bit columns start at the same x for every row
-            # width is in characters; adjust to taste if your font is wider/narrower
-            ttk.Label(row, text=f"Byte {byte_index:02d}:", width=9)\
-                .grid(row=0, column=0, sticky="w", padx=(0, 6))
-
-            row_checks = []
-            # MSB..LSB laid out left→right as columns 1..8
-            for col, bit in enumerate(range(7, -1, -1), start=1):
-                v = tk.IntVar(value=(b >> bit) & 1)
-                chk = ttk.Checkbutton(row, variable=v, command=self._make_callback())
-                # Kill any internal padding to keep columns tight
-                try:
-                    chk.configure(padding=0)
-                except Exception:
-                    pass
-                chk.grid(row=0, column=col, sticky="w", padx=(0, 0), pady=0, ipadx=0, ipady=0)
-                self._vars.append((byte_index, bit, v))
-                row_checks.append(chk)
-
-            # Give each bit-column a consistent pixel width so columns align across rows
-            # Measure once from this row's checkbuttons (works cross-platform)
+        cells: list[tuple[int, int]] = []
+        # MSB..LSB laid out left→right, starting at the same x for every row
+        x = self._label_width(label) + self._LABEL_PAD
+        for bit in range(7, -1, -1):
+            tags = ("bit", row_tag, f"bit:{byte_index}:{bit}")
+            rect = c.create_rectangle(
+                x, top + 1, x + self._CELL_W - 2, top + self._ROW_H - 2,
+                fill=self._OFF_FILL, outline=self._OUTLINE, tags=tags,
+            )
+            text = c.create_text(
+                x + (self._CELL_W - 2) // 2, mid,
+                text="0", fill=self._OFF_TEXT, font=self._FONT, tags=tags,
+            )
+            cells.append((rect, text))
+            x += self._CELL_W
+        return label, cells
+
+    def _label_width(self, label: int) -> int:
+        """Row-label width, measured from the first label drawn."""
+        if BitToggleField._CACHED_LABEL_W is None:
             try:
-                self.update_idletasks()
-                col_w = max(cb.winfo_reqwidth() for cb in row_checks) if row_checks else 18
+                x0, _, x1, _ = self._canvas.bbox(label)
+                BitToggleField._CACHED_LABEL_W = x1 - x0
             except Exception:
-                col_w = 18  # safe fallback
-
-            for col in range(1, 9):
-                row.grid_columnconfigure(col, minsize=col_w, weight=0)
+                BitToggleField._CACHED_LABEL_W = 64  # safe fallback
+        return BitToggleField._CACHED_LABEL_W
 
-            # Keep the label column non-stretchy as well
-            row.grid_columnconfigure(0, weight=0)
+    def _paint_cell(self, cell: tuple[int, int], on: int) -> None:
+        rect, text = cell
+        self._canvas.itemconfigure(rect, fill=self._ON_FILL if on else self._OFF_FILL)
+        self._canvas.itemconfigure(text, text="1" if on else "0", fill=self._ON_TEXT if on else self._OFF_TEXT)
 
-    def _make_callback(self):
-        return lambda: self._on_bits_changed(self.get_bytes())
+    def set_bits(self, data: bytes) -> None:
+        """Show one row per byte (display order: MSB..LSB), repainting only flipped bits."""
+        old, shown = self._data, self._visible
+        c = self._canvas
 
-    def get_bytes(self) -> bytes:
-        """Return the current bytes represented by the toggles (display order)."""
-        if not self._vars:
-            return b""
+        for byte_index, b in enumerate(data):
+            if byte_index < len(self._rows):
+                _, cells = self._rows[byte_index]
+            else:
+                self._rows.append(self._build_row(byte_index))
+                _, cells = self._rows[byte_index]
 
-        grouped: dict[int, list[tuple[int, tk.IntVar]]] = {}
-        for byte_index, bit, v in self._vars:
-            grouped.setdefault(byte_index, []).append((bit, v))
+            if byte_index >= shown:
+                c.itemconfigure(f"row:{byte_index}", state="normal")
+                changed = 0xFF  # row was hidden, so its cells may be stale
+            else:
+                changed = old[byte_index] ^ b
+            for cell, bit in zip(cells, range(7, -1, -1)):
+                if (changed >> bit) & 1:
+                    self._paint_cell(cell, (b >> bit) & 1)
+
+        # Hide (but keep) rows beyond the current byte count
+        for byte_index in range(len(data), shown):
+            c.itemconfigure(f"row:{byte_index}", state="hidden")
+
+        self._data = bytearray(data)
+        self._visible = len(data)
+        if self._visible != shown:
+            width = self._label_width(self._rows[0][0]) + self._LABEL_PAD + 8 * self._CELL_W if self._rows else 0
+            c.configure(width=width, height=self._visible * self._ROW_H)
+
+    def _on_click(self, _event) -> None:
+        for tag in self._canvas.gettags("current"):
+            if tag.startswith("bit:"):
+                _, byte_index, bit = tag.split(":")
+                self._toggle(int(byte_index), int(bit))
+                return
 
-        out = bytearray()
-        for byte_index in sorted(grouped):
-            val = 0
-            for bit, v in grouped[byte_index]:
-                if v.get():
-                    val |= (1 << bit)
-            out.append(val)
+    def _toggle(self, byte_index: int, bit: int) -> None:
+        self._data[byte_index] ^= 1 << bit
+        _, cells = self._rows[byte_index]
+        self._paint_cell(cells[7 - bit], (self._data[byte_index] >> bit) & 1)
+        self._on_bits_changed(bytes(self._data))
 
-        return bytes(out)
+    def get_bytes(self) -> bytes:
+        """Return the current bytes represented by the toggles (display order)."""
+        return bytes(self._data)
 
 
 class MultiRowField(ttk.Frame):
@@ -124,7 +191,9 @@ class MultiRowField(ttk.Frame):
         compact_by: str = "view",
         # "min" = narrowest fit, "max" = widest fit
         width_strategy: str = "max",
-        pad_chars: int = 0
+        pad_chars: int = 0,
+        # monospaced font helps binary readability
+        monospaced: bool = True,
     ):
         """
         MultiRowField constructor.
@@ -136,6 +205,7 @@ class MultiRowField(ttk.Frame):
             compact_by: "view" (same width for all) or "column" (width computed per column)
             width_strategy: "min" (narrowest) or "max" (widest)
             pad_chars: characters of extra width padding to avoid clipping
+            monospaced: render cells in TkFixedFont
         """
         super().__init__(parent)
 
@@ -146,9 +216,15 @@ class MultiRowField(ttk.Frame):
         self._width_strategy = width_strategy
         self._pad_chars = pad_chars
 
-        # Track layout widgets
+        # Pooled layout widgets: one frame per wrapped block, cells keyed by (row, col)
+        # within it; the first `_visible_blocks` frames are gridded
         self._blocks: list[ttk.Frame] = []
-        self._buttons: list[ttk.Button] = []
+        self._block_cells: list[dict[tuple[int, int], ttk.Button]] = []
+        self._block_fillers: list[dict[tuple[int, int], ttk.Label]] = []
+        self._block_shown: list[set[ttk.Widget]] = []  # cells currently gridded, per block
+        self._cell_config: dict[ttk.Button, tuple] = {}  # (text, width, anchor) last applied
+        self._visible_blocks = 0
+        self._buttons: list[ttk.Button] = []  # shown buttons, in layout order
 
         # Styling
         self._style = ttk.Style(self)
@@ -173,19 +249,42 @@ class MultiRowField(ttk.Frame):
             relief=[('pressed', 'sunken'), ('!pressed', 'flat')]
         )
 
+        # Styles are app-global, so the font only needs configuring once
+        if monospaced:
+            try:
+                self._style.configure(self._cell_style, font=("TkFixedFont", 11))
+            except Exception:
+                pass
+
     def clear(self) -> None:
         for f in self._blocks:
             f.destroy()
         self._blocks.clear()
+        self._block_cells.clear()
+        self._block_fillers.clear()
+        self._block_shown.clear()
+        self._cell_config.clear()
+        self._visible_blocks = 0
         self._buttons.clear()
 
+    def invalidate_cells(self) -> None:
+        """Forget the applied cell configs, so the next set_values re-applies every cell."""
+        self._cell_config.clear()
+
+    def _show_blocks(self, count: int) -> None:
+        """Hide (but keep) blocks from `count` on."""
+        for block in self._blocks[count:self._visible_blocks]:
+            block.grid_remove()
+        self._visible_blocks = min(self._visible_blocks, count)
+        if count == 0:
+            self._buttons = []
+
     def set_values(
         self,
         rows: list[list[str]] | list[str],
         *,
         pad: tuple[int, int] = (0, 0),        # (padx, pady) for each cell
         anchor: str = "w",                    # left-align long strings
-        monospaced: bool = True,              # helps binary readability
     ) -> None:
         """
         Render a matrix of values as buttons. `rows` can be:
@@ -200,103 +299,120 @@ class MultiRowField(ttk.Frame):
         """
         # Normalize input to a 2D list
         if not rows:
-            self.clear()
+            self._show_blocks(0)
             return
         if rows and all(isinstance(x, str) for x in rows):
             rows = [list(rows)]  # single row
 
-        # Clear previous layout
-        self.clear()
-
         # Basic shape
         max_cols = max((len(r) for r in rows), default=0)
         if max_cols == 0:
+            self._show_blocks(0)
             return
 
-        # Compute per-column widths (in "characters")
-        lengths_by_col: list[list[int]] = [[] for _ in range(max_cols)]
+        # Compute per-column widths (in "characters") as a running max/min;
+        # every column below max_cols holds at least one cell
+        widest = self._width_strategy == "max"
+        col_widths = [0 if widest else sys.maxsize] * max_cols
         for r in rows:
             for c, v in enumerate(r):
-                txt = "" if v is None else str(v)
-                lengths_by_col[c].append(len(txt))
-
-        def choose_width(nums: list[int]) -> int:
-            if not nums:
-                return 1
-            if getattr(self, "_width_strategy", "min") == "max":
-                return max(nums)
-            return min(nums)
-
-        if getattr(self, "_compact_by", "view") == "column":
-            col_widths = [max(1, choose_width(lens)) for lens in lengths_by_col]
-        else:
+                n = 0 if v is None else len(v) if isinstance(v, str) else len(str(v))
+                if (n > col_widths[c]) if widest else (n < col_widths[c]):
+                    col_widths[c] = n
+
+        if self._compact_by != "column":
             # Global width across all cells
-            all_lengths = [n for col in lengths_by_col for n in col]
-            global_w = max(1, choose_width(all_lengths))
-            col_widths = [global_w] * max_cols
+            col_widths = [max(col_widths) if widest else min(col_widths)] * max_cols
 
         # Apply padding
-        pad_chars = int(getattr(self, "_pad_chars", 0) or 0)
+        pad_chars = int(self._pad_chars or 0)
         col_widths = [max(1, w + pad_chars) for w in col_widths]
 
-        # Optional monospaced font for better binary readability
-        if monospaced:
-            try:
-                self._style.configure(self._cell_style, font=("TkFixedFont", 11))
-            except Exception:
-                pass
-
         padx, pady = pad
         running_idx = 0
         block_idx = 0
+        buttons: list[ttk.Button] = []
 
         while running_idx < max_cols:
             take = min(self._wrap, max_cols - running_idx)
-            block = ttk.Frame(self)
-            block.grid(row=block_idx, column=0, sticky="w")
-            self._blocks.append(block)
+            if block_idx == len(self._blocks):
+                self._blocks.append(ttk.Frame(self))
+                self._block_cells.append({})
+                self._block_fillers.append({})
+                self._block_shown.append(set())
+            block = self._blocks[block_idx]
+            cells = self._block_cells[block_idx]
+            fillers = self._block_fillers[block_idx]
+            was_shown = self._block_shown[block_idx]
+            shown: set[ttk.Widget] = set()
 
             for r_index, row_vals in enumerate(rows):
                 for col_idx in range(take):
+                    key = (r_index, col_idx)
                     abs_col = running_idx + col_idx
                     if abs_col < len(row_vals):
                         val = row_vals[abs_col]
                         text = "" if val is None else str(val)
-                        btn = ttk.Button(block, text=text, style=self._cell_style)
-                        # width & anchor
-                        try:
-                            btn.config(width=col_widths[abs_col], anchor=anchor, padding=0)
-                        except Exception:
-                            btn.config(width=col_widths[abs_col], padding=0)
-                        if hasattr(self, "_on_copy"):
-                            btn.config(command=lambda v=text, b=btn: self._on_copy(v, b))
-                        btn.grid(
-                            row=r_index,
-                            column=col_idx,
-                            padx=padx,
-                            pady=pady,
-                            ipadx=0,
-                            ipady=0,
-                            sticky="w"
-                        )
-                        self._buttons.append(btn)
+                        btn = cells.get(key)
+                        if btn is None:
+                            btn = cells[key] = ttk.Button(block, style=self._cell_style)
+                        # Only touch Tk when the cell actually changed
+                        config = (text, col_widths[abs_col], anchor)
+                        if self._cell_config.get(btn) != config:
+                            self._cell_config[btn] = config
+                            # text, width & anchor
+                            try:
+                                btn.config(text=text, width=col_widths[abs_col], anchor=anchor, padding=0)
+                            except Exception:
+                                btn.config(text=text, width=col_widths[abs_col], padding=0)
+                            btn.config(command=partial(self._on_copy, text, btn))
+                        if btn not in was_shown:
+                            btn.grid(
+                                row=r_index,
+                                column=col_idx,
+                                padx=padx,
+                                pady=pady,
+                                ipadx=0,
+                                ipady=0,
+                                sticky="w"
+                            )
+                        shown.add(btn)
+                        buttons.append(btn)
                     else:
                         # keep the grid aligned when this row is shorter
-                        ttk.Label(block, text="").grid(row=r_index, column=col_idx, padx=padx, pady=pady, sticky="w")
-
-            # Align columns within this block
-            for col_idx in range(take):
-                block.grid_columnconfigure(col_idx, weight=0)
+                        filler = fillers.get(key)
+                        if filler is None:
+                            filler = fillers[key] = ttk.Label(block, text="")
+                        if filler not in was_shown:
+                            filler.grid(row=r_index, column=col_idx, padx=padx, pady=pady, sticky="w")
+                        shown.add(filler)
+
+            # Hide (but keep) cells this render doesn't use
+            for w in was_shown - shown:
+                w.grid_remove()
+            self._block_shown[block_idx] = shown
+
+            # Align columns within this block (Tk takes a list of indices: one call per block)
+            block.grid_columnconfigure(tuple(range(take)), weight=0)
+            if block_idx >= self._visible_blocks:
+                block.grid(row=block_idx, column=0, sticky="w")
 
             running_idx += take
             block_idx += 1
 
+        self._show_blocks(block_idx)
+        self._visible_blocks = block_idx
+        self._buttons = buttons
+
 
 class CopyButtonsField(ttk.Frame):
     """Render N buttons in a horizontal row that expands with the window width."""
     def __init__(self, parent, on_copy):
         super().__init__(parent)
+        # Pool of buttons; the first `_visible` are packed, the rest are hidden
         self._buttons: list[ttk.Button] = []
+        self._configs: list[tuple] = []  # (value, width) last applied, per pooled button
+        self._visible = 0
         self._on_copy = on_copy
 
     def clear_buttons(self) -> None:
@@ -304,26 +420,40 @@ class CopyButtonsField(ttk.Frame):
         for btn in self._buttons:
             btn.destroy()
         self._buttons.clear()
+        self._configs.clear()
+        self._visible = 0
 
     def set_values(self, values: list[str], button_width: int | None = None) -> None:
-        """Replace current buttons with a new set of buttons."""
-        self.clear_buttons()
-
-        for val in values:
-            btn = ttk.Button(self, text=val)
-
-            if button_width is not None:
-                btn.config(width=button_width)
-
-            btn.config(command=partial(self._on_copy, val, btn))
-            btn.pack(side="left", padx=4, pady=2)
-
-            self._buttons.append(btn)
+        """Show one button per value, reusing pooled buttons where possible."""
+        for i, val in enumerate(values):
+            if i < len(self._buttons):
+                btn = self._buttons[i]
+            else:
+                btn = ttk.Button(self)
+                self._buttons.append(btn)
+                self._configs.append(())
+
+            # No width: "" restores the TButton style default (a pooled button may
+            # still carry an explicit width from an earlier call)
+            width = button_width if button_width is not None else ""
+            # Same value and width as last time: leave the button alone
+            if self._configs[i] != (val, width):
+                self._configs[i] = (val, width)
+                btn.config(text=val, width=width, command=partial(self._on_copy, val, btn))
+            if i >= self._visible:
+                btn.pack(side="left", padx=4, pady=2)
+
+        # Hide (but keep) surplus buttons from a previous, longer set
+        for btn in self._buttons[len(values):self._visible]:
+            btn.pack_forget()
+        self._visible = len(values)
 
 
 class ConverterApp:
     """Tkinter GUI wrapper around the pure logic functions, with mode-specific UIs."""
     MODES = ("HEX", "Number", "String")
+    # Trailing-edge debounce for live-typing updates (milliseconds)
+    UPDATE_DELAY_MS = 100
 
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
@@ -344,6 +474,34 @@ class ConverterApp:
         self._bit_display_chunk_sizes: list[int] = []
         self.str_group_mode_var = tk.StringVar(value="1")
         self.str_custom_groups_var = tk.StringVar(value="")
+        self._pending_update: str | None = None  # Tk after() id of the debounced update
+        self._pending_idle: str | None = None    # Tk after_idle() id of the coalesced update
+        self._updating = False  # a recompute (or an internal input write) is in progress
+        self._dirty = False     # an update was requested while _updating; re-run once at idle
+        self._last_update_key: tuple | None = None  # inputs behind what the current view shows
+        self._last_rendered_mode: str | None = None
+        self._pending_restores: dict[ttk.Button, str] = {}  # button -> after() id of its label restore
+        self._last_encoded: tuple[str, bytes] = ("", b"")  # String view: (text, latin-1 bytes)
+        self.compact_mode = False
+
+        # Per-view widgets/vars, created by the _build_*_ui methods (None until then)
+        self.hex_input_var: tk.StringVar | None = None
+        self.hex_error_var: tk.StringVar | None = None
+        self.hex_group_mode_var: tk.StringVar | None = None
+        self.hex_custom_groups_entry: ttk.Entry | None = None
+        self.num_input_var: tk.StringVar | None = None
+        self.width_var: tk.IntVar | None = None
+        self.repr_var: tk.StringVar | None = None
+        self.int_range_var: tk.StringVar | None = None
+        self.int_error_var: tk.StringVar | None = None
+        self.int_bytes_hex_btns: CopyButtonsField | None = None
+        self.num_bit_toggles: BitToggleField | None = None
+        self.custom_groups_entry: ttk.Entry | None = None
+        self._int_cleared = True
+        self.str_input_var: tk.StringVar | None = None
+        self.str_error_var: tk.StringVar | None = None
+        self.str_custom_groups_entry: ttk.Entry | None = None
+        self.str_bytes_grid: MultiRowField | None = None
 
         # Build shared UI
         build_menubar(self.root, self)
@@ -393,7 +551,74 @@ class ConverterApp:
             ).pack(side="left", padx=(0,10))
 
         # Live updates when typing custom pattern
-        self.custom_groups_var.trace_add("write", lambda *_: self._update_current_mode())
+        self.custom_groups_var.trace_add("write", lambda *_: self._schedule_update(self._update_current_mode))
+
+    def _schedule_update(self, fn) -> None:
+        """Debounce live updates: run `fn` once, after input has settled."""
+        if self._updating:
+            self._dirty = True
+            return
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(self.UPDATE_DELAY_MS, self._run_pending_update, fn)
+
+    def _run_pending_update(self, fn) -> None:
+        self._pending_update = None
+        self._guarded_update(fn)
+
+    def _schedule_idle_update(self, fn) -> None:
+        """Coalesce a burst of trace writes (e.g. a paste) into one `fn` run once Tk is idle."""
+        if self._updating:
+            self._dirty = True
+            return
+        if self._pending_idle is None:
+            self._pending_idle = self.root.after_idle(self._run_idle_update, fn)
+
+    def _run_idle_update(self, fn) -> None:
+        self._pending_idle = None
+        self._guarded_update(fn)
+
+    def _guarded_update(self, fn) -> None:
+        """Run `fn` unless an update is already in progress (then it is re-run once, at idle)."""
+        if self._updating:
+            self._dirty = True
+            return
+        with self._suppress_updates():
+            fn()
+
+    @contextmanager
+    def _suppress_updates(self):
+        """
+        Hold off trace-driven updates while the app writes its own inputs; any
+        requested meanwhile collapse into a single recompute from after_idle.
+        """
+        if self._updating:
+            yield
+            return
+        self._updating = True
+        try:
+            yield
+        finally:
+            self._updating = False
+            if self._dirty:
+                self._dirty = False
+                self.root.after_idle(self._update_current_mode)
+
+    def _unchanged_since_last_update(self, key: tuple) -> bool:
+        """True when the view already shows the result for `key`; otherwise remember it."""
+        if key == self._last_update_key:
+            return True
+        self._last_update_key = key
+        return False
+
+    def _cancel_pending_update(self) -> None:
+        """Drop any queued debounced or idle update."""
+        if self._pending_update is not None:
+            self.root.after_cancel(self._pending_update)
+            self._pending_update = None
+        if self._pending_idle is not None:
+            self.root.after_cancel(self._pending_idle)
+            self._pending_idle = None
 
     def _show_about(self):
         show_about_dialog(self, self.root)
@@ -419,18 +644,18 @@ class ConverterApp:
         # Map each scope to (group_mode_var, custom_entry_widget, update_fn)
         mapping = {
             "HEX": (
-                getattr(self, "hex_group_mode_var", None),
-                getattr(self, "hex_custom_groups_entry", None),
+                self.hex_group_mode_var,
+                self.hex_custom_groups_entry,
                 self._update_from_hex,
             ),
             "Number": (
-                getattr(self, "group_mode_var", None),
-                getattr(self, "custom_groups_entry", None),
+                self.group_mode_var,
+                self.custom_groups_entry,
                 self._update_from_number,
             ),
             "String": (
-                getattr(self, "str_group_mode_var", None),
-                getattr(self, "str_custom_groups_entry", None),
+                self.str_group_mode_var,
+                self.str_custom_groups_entry,
                 self._update_from_string,
             ),
         }
@@ -455,11 +680,20 @@ class ConverterApp:
         update_fn()
 
     def _render_mode(self) -> None:
+        # Re-selecting the mode already shown is a no-op, not a rebuild
+        mode = self.mode_var.get()
+        if mode == self._last_rendered_mode:
+            return
+        self._last_rendered_mode = mode
+
+        # A queued update targets the widgets about to be destroyed
+        self._cancel_pending_update()
+        self._last_update_key = None
+
         # Clear current content
         for w in self.content.winfo_children():
             w.destroy()
 
-        mode = self.mode_var.get()
         if mode == "HEX":
             self._build_hex_ui(self.content)
             self._on_group_mode_changed("HEX")
@@ -469,20 +703,23 @@ class ConverterApp:
             self._build_string_ui(self.content)
 
     def _set_error_state(self, msg: str) -> None:
-        if hasattr(self, "hex_error_var"):
-            self.hex_error_var.set(msg)
+        if self.hex_error_var is not None:
+            _set_if_changed(self.hex_error_var, msg)
         else:
             print("Error:", msg)
 
     def _toggle_compact(self):
         """Toggle compact view mode for byte rows and refresh UI."""
-        self.compact_mode = not getattr(self, "compact_mode", False)
+        self.compact_mode = not self.compact_mode
 
         # Update ByteRowsField styling (e.g., reduce padding when compact)
-        if hasattr(self, "str_bytes_grid"):
+        if self.str_bytes_grid is not None:
             for btn in self.str_bytes_grid._buttons:
                 btn.config(padding=0 if self.compact_mode else 4)
+            # The refresh below re-applies every cell (padding included), not just changed ones
+            self.str_bytes_grid.invalidate_cells()
 
+        self._last_update_key = None
         self._update_current_mode()
 
     def _update_current_mode(self) -> None:
@@ -498,13 +735,25 @@ class ConverterApp:
 
     # ----------------- Clipboard helpers -----------------
     def copy_value(self, value: str, btn: ttk.Button | None = None) -> None:
+        """Copy `value`; flash "Copied!" on `btn`, then restore its label (the value itself)."""
         self.root.clipboard_clear()
         self.root.clipboard_append(value)
         self.root.update()
         if btn:
-            old = btn['text']
+            # A repeat click restarts the feedback instead of stacking restores
+            pending = self._pending_restores.pop(btn, None)
+            if pending is not None:
+                self.root.after_cancel(pending)
             btn.config(text="Copied!")
-            self.root.after(750, lambda: btn.config(text=old))
+            self._pending_restores[btn] = self.root.after(750, self._restore_label, btn, value)
+
+    def _restore_label(self, btn: ttk.Button, label: str) -> None:
+        """Undo the "Copied!" feedback (the button may have been destroyed meanwhile)."""
+        self._pending_restores.pop(btn, None)
+        try:
+            btn.config(text=label)
+        except tk.TclError:
+            pass
 
     def paste_into(self, var: tk.StringVar) -> None:
         try:
@@ -623,18 +872,27 @@ class ConverterApp:
 
         # --- Wire events AFTER widgets exist ---
         # Custom pattern live updates
-        self.hex_custom_groups_var.trace_add("write", lambda *_: self._update_from_hex())
+        self.hex_custom_groups_var.trace_add("write", lambda *_: self._schedule_update(self._update_from_hex))
         # Enable/disable the custom entry now that it exists
         self._on_group_mode_changed("HEX")
 
         # Input live updates
-        self.hex_input_var.trace_add("write", lambda *_: self._update_from_hex())
+        self.hex_input_var.trace_add("write", lambda *_: self._schedule_update(self._update_from_hex))
         entry.focus()
 
         # Initial compute (safe now)
         self.hex_input_var.set("E8 08 B0 04 00 00 2C 01")
 
     def _update_from_hex(self) -> None:
+        key = (
+            "HEX",
+            self.hex_input_var.get(),
+            self.endian_var.get(),
+            self.hex_group_mode_var.get(),
+            self.hex_custom_groups_var.get(),
+        )
+        if self._unchanged_since_last_update(key):
+            return
         try:
             data = parse_hex_bytes(self.hex_input_var.get())
 
@@ -649,8 +907,7 @@ class ConverterApp:
                 self.bit_toggles.set_bits(b"")
                 self.text_btns.set_values([])
                 self._bit_display_chunk_sizes = []
-                if hasattr(self, "hex_error_var"):
-                    self.hex_error_var.set("")
+                _set_if_changed(self.hex_error_var, "")
                 return
 
             mode   = self.hex_group_mode_var.get()
@@ -692,12 +949,7 @@ class ConverterApp:
                     display_chunks.append(chunk)
 
             # Hex groups (from display-order chunks)
-            hex_groups = []
-            for chunk in display_chunks:
-                parts = []
-                for byte in chunk:
-                    parts.append(f"{byte:02X}")
-                hex_groups.append(" ".join(parts))
+            hex_groups = [chunk.hex(" ").upper() for chunk in display_chunks]
             self.hex_group_btns.set_values(hex_groups)
 
             # Text groups (grouped the same way)
@@ -708,22 +960,20 @@ class ConverterApp:
             self.text_btns.set_values(text_groups)
 
             # Keep toggle chunk sizes in sync with what's shown
-            sizes_out = []
-            for chunk in display_chunks:
-                sizes_out.append(len(chunk))
-            self._bit_display_chunk_sizes = sizes_out
+            self._bit_display_chunk_sizes = list(map(len, display_chunks))
 
             # Flatten into a single display-order byte stream
             display_bytes = b"".join(display_chunks)
 
             # Numeric interpretations per group
             unsigned_vals = []
-            for chunk in display_chunks:
-                unsigned_vals.append(int.from_bytes(chunk, byteorder="big", signed=False))
-
             twos_vals = []
             for chunk in display_chunks:
-                twos_vals.append(int.from_bytes(chunk, byteorder="big", signed=True))
+                u = int.from_bytes(chunk, byteorder="big", signed=False)
+                unsigned_vals.append(u)
+                # 2's complement from the same conversion: subtract 2^n when the sign bit is set
+                bits = 8 * len(chunk)
+                twos_vals.append(u - (1 << bits) if u >> (bits - 1) else u)
 
             ones_vals = []
             for chunk in display_chunks:
@@ -739,17 +989,14 @@ class ConverterApp:
             self.signed_signmag_btns.set_values(signmag_vals)
 
             # Binary (display order) & bit toggles
-            bin_vals = []
-            for byte in display_bytes:
-                bin_vals.append(f"{byte:08b}")
-            self.bin_btns.set_values(bin_vals)
+            self.bin_btns.set_values(list(map(BIN8.__getitem__, display_bytes)))
 
             self.bit_toggles.set_bits(display_bytes)
 
-            if hasattr(self, "hex_error_var"):
-                self.hex_error_var.set("")
+            _set_if_changed(self.hex_error_var, "")
 
         except ValueError as e:
+            self._last_update_key = None
             self._set_error_state(str(e))
 
     def _update_from_bits(self, new_display_bytes: bytes) -> None:
@@ -758,7 +1005,7 @@ class ConverterApp:
         order shown in the Binary row where per-chunk endianness has been applied).
         Convert back to canonical input order before writing to the hex field.
         """
-        sizes = getattr(self, "_bit_display_chunk_sizes", []) or [len(new_display_bytes)]
+        sizes = self._bit_display_chunk_sizes or [len(new_display_bytes)]
         endian = self.endian_var.get()
 
         out = bytearray()
@@ -778,8 +1025,9 @@ class ConverterApp:
                 seg = seg[::-1]
             out.extend(seg)
 
-        # Writing to the input triggers a full recompute
-        self.hex_input_var.set(" ".join(f"{b:02X}" for b in out))
+        # Writing to the input triggers a full recompute (once, at idle)
+        with self._suppress_updates():
+            self.hex_input_var.set(out.hex(" ").upper())
 
 
     # ===========================================================
@@ -862,26 +1110,37 @@ class ConverterApp:
         self.int_decimal_btns = CopyButtonsField(parent, on_copy=self.copy_value)
         self.int_decimal_btns.grid(row=r, column=1, sticky="ew")
         r += 1
+        self._int_cleared = True  # fresh outputs start empty
 
         # Live updates
-        self.num_input_var.trace_add("write", lambda *_: self._update_from_number())
-        self.width_var.trace_add("write", lambda *_: self._update_from_number())
+        self.num_input_var.trace_add("write", lambda *_: self._schedule_idle_update(self._update_from_number))
+        self.width_var.trace_add("write", lambda *_: self._schedule_idle_update(self._update_from_number))
         int_entry.focus()
         self.num_input_var.set("0xE808B004")
 
     def _clear_int_outputs(self) -> None:
-        if hasattr(self, "int_bytes_hex_btns"):
-            self.int_bytes_hex_btns.set_values([])
-            self.int_bin_btns.set_values([])
-            if hasattr(self, "int_text_btns"):
-                self.int_text_btns.set_values([])
-            if hasattr(self, "int_hex_scalar_btns"):
-                self.int_hex_scalar_btns.set_values([])
-            if hasattr(self, "int_decimal_btns"):
-                self.int_decimal_btns.set_values([])
+        # Partial input (e.g. "0x") fails on every keystroke; only clear once
+        if self._int_cleared or self.int_bytes_hex_btns is None:
+            return
+        self._int_cleared = True
+        # The Number view builds all of its output fields together
+        self.int_bytes_hex_btns.set_values([])
+        self.int_bin_btns.set_values([])
+        self.int_text_btns.set_values([])
+        self.int_hex_scalar_btns.set_values([])
+        self.int_decimal_btns.set_values([])
 
     def _update_from_number(self) -> None:
-        if not hasattr(self, "num_input_var"):
+        if self.num_input_var is None:
+            return
+        key = (
+            "Number",
+            self.num_input_var.get(),
+            self.width_var.get(),
+            self.endian_var.get(),
+            self.repr_var.get(),
+        )
+        if self._unchanged_since_last_update(key):
             return
         try:
             val = parse_int_maybe(self.num_input_var.get())
@@ -895,18 +1154,25 @@ class ConverterApp:
             # Convert integer to bytes using centralized logic
             data = int_to_bytes(val, width, mode, endian)
 
-            # Update outputs
-            self.int_bytes_hex_btns.set_values([" ".join(f"{b:02X}" for b in data)])
-            self.int_bin_btns.set_values([f"{b:08b}" for b in data])
+            # Build every output first, then apply them back to back, so a failure
+            # can't leave the view half-updated
+            payloads = [
+                (self.int_bytes_hex_btns, [data.hex(" ").upper()]),
+                (self.int_bin_btns, list(map(BIN8.__getitem__, data))),
+                (self.int_text_btns, bytes_to_ascii_runs(data)),
+                (self.int_hex_scalar_btns, [hex(val & ((1 << (width * 8)) - 1))]),
+                (self.int_decimal_btns, [str(val)]),
+            ]
+            self._int_cleared = False
+            for field, values in payloads:
+                field.set_values(values)
             self.num_bit_toggles.set_bits(data)
-            self.int_text_btns.set_values(bytes_to_ascii_runs(data))
-            self.int_hex_scalar_btns.set_values([hex(val & ((1 << (width*8))-1))])
-            self.int_decimal_btns.set_values([str(val)])
-            self.int_error_var.set("")
+            _set_if_changed(self.int_error_var, "")
 
         except Exception as exc:
+            self._last_update_key = None
             self._update_number_range_label()
-            self.int_error_var.set(str(exc))
+            _set_if_changed(self.int_error_var, str(exc))
             self._clear_int_outputs()
             self.num_bit_toggles.set_bits(b"")
 
@@ -915,7 +1181,7 @@ class ConverterApp:
         Called when toggles in Number View change.
         Updates the numeric input according to the current representation and endianness.
         """
-        if not hasattr(self, "num_input_var"):
+        if self.num_input_var is None:
             return
 
         endian = self.endian_var.get()
@@ -930,29 +1196,26 @@ class ConverterApp:
 
         try:
             val = bytes_to_int(data, mode, "big")  # bytes_to_int expects logical "big" order
-            self.num_input_var.set(str(val))
-            self.int_error_var.set("")
+            text = str(val)
+            if self.num_input_var.get() == text:
+                # Same number, different bits (e.g. 1's complement -0): no input write,
+                # just re-render so the toggles snap back to the number's bytes
+                self._last_update_key = None
+                self._guarded_update(self._update_from_number)
+            else:
+                with self._suppress_updates():
+                    self.num_input_var.set(text)
+            _set_if_changed(self.int_error_var, "")
         except Exception as exc:
-            self.int_error_var.set(str(exc))
+            _set_if_changed(self.int_error_var, str(exc))
 
     def _update_number_range_label(self) -> None:
         """Compute and display the valid range for current width/representation."""
-        if not hasattr(self, "width_var") or not hasattr(self, "repr_var"):
+        if self.width_var is None or self.repr_var is None:
             return
         width = max(1, min(MAX_BYTES, int(self.width_var.get() or 1)))
-        mode = self.repr_var.get()
-
-        if mode == "Unsigned":
-            lo, hi = int_range_for(width, signed=False)
-        elif mode == "Signed (2's complement)":
-            lo, hi = int_range_for(width, signed=True)
-        else:
-            # 1's complement and sign-magnitude share the same numeric bounds:
-            # [-(2^(n-1)-1), 2^(n-1)-1]
-            nbits = 8 * width
-            hi = (1 << (nbits - 1)) - 1
-            lo = -hi
-        self.int_range_var.set(f"Valid range: {lo:,} to {hi:,}")
+        label = _range_label(width, self.repr_var.get())
+        _set_if_changed(self.int_range_var, label)
 
     # ===========================================================
     # ============  STRING MODE (text -> bytes …) ===============
@@ -1044,7 +1307,7 @@ class ConverterApp:
         r += 1
 
         # Live updates when typing custom pattern
-        self.str_custom_groups_var.trace_add("write", lambda *_: self._update_from_string())
+        self.str_custom_groups_var.trace_add("write", lambda *_: self._schedule_update(self._update_from_string))
 
         # (GROUPS): Values
         self.str_groups_grid = MultiRowField(parent, on_copy=self.copy_value, wrap=16, compact_by="column")
@@ -1055,18 +1318,34 @@ class ConverterApp:
         self._on_group_mode_changed("String")
 
         # Live updates
-        self.str_input_var.trace_add("write", lambda *_: self._update_from_string())
+        self.str_input_var.trace_add("write", lambda *_: self._schedule_idle_update(self._update_from_string))
         str_entry.focus()
 
         # Initial compute
         self.str_input_var.set("Hello, CAN!")
 
+    def _encode_string_input(self, text: str) -> bytes:
+        """latin-1 bytes for `text`, reused while only endian/grouping change."""
+        if text != self._last_encoded[0]:
+            self._last_encoded = (text, text.encode("latin-1", errors="replace"))
+        return self._last_encoded[1]
+
     def _update_from_string(self) -> None:
-        if not hasattr(self, "str_input_var"):
+        if self.str_input_var is None:
+            return
+        text = self.str_input_var.get()
+        key = (
+            "String",
+            text,
+            self.endian_var.get(),
+            self.str_group_mode_var.get(),
+            self.str_custom_groups_var.get(),
+        )
+        if self._unchanged_since_last_update(key):
             return
         try:
-            raw = self.str_input_var.get().encode("latin-1", errors="replace")
-            self.str_error_var.set("")
+            raw = self._encode_string_input(text)
+            _set_if_changed(self.str_error_var, "")
 
             if not raw:
                 # Clear all outputs (bytes + groups)
@@ -1077,41 +1356,35 @@ class ConverterApp:
             mode = self.str_group_mode_var.get()
 
             # ----- Byte view -----
-            hex_vals = [f"{b:02X}" for b in raw]
-            bin_vals = [f"{b:08b}" for b in raw]
+            hex_vals = list(map(HEX2.__getitem__, raw))
+            bin_vals = list(map(BIN8.__getitem__, raw))
 
             self.str_bytes_grid.set_values([hex_vals, bin_vals])
             self.str_text_byte_btns.set_values(bytes_to_ascii_runs(raw))
 
             # ----- Group view -----
-            # Build groups consistent with hex grouping (apply endianness within each group)
+            # Build groups consistent with hex grouping (apply endianness within each group);
+            # chunks are zero-copy views, reversed views for little-endian
+            mv = memoryview(raw)
             if mode == "custom":
                 sizes = parse_groups_pattern(self.str_custom_groups_var.get())
-                # build chunks by sizes
-                chunks = []
-                i = 0
-                for sz in sizes:
-                    if i >= len(raw): break
-                    ch = raw[i:i+sz]
-                    chunks.append(ch[::-1] if endian == "little" else ch)
-                    i += sz
-                if i < len(raw) and sizes:
-                    ch = raw[i:]
-                    chunks.append(ch[::-1] if endian == "little" else ch)
+                # No groups until a pattern is entered
+                chunks = group_bytes_by_sizes(mv, sizes) if sizes else []
             else:
                 g = int(mode)
-                chunks = [raw[i:i+g] for i in range(0, len(raw), g)]
-                if endian == "little":
-                    chunks = [ch[::-1] for ch in chunks]
+                chunks = [mv[i:i+g] for i in range(0, len(raw), g)]
+            if endian == "little":
+                chunks = [ch[::-1] for ch in chunks]
 
             # Groups
-            hex_groups = [" ".join(f"{b:02X}" for b in ch) for ch in chunks]
-            bin_groups = [" ".join(f"{b:08b}" for b in ch) for ch in chunks]
+            hex_groups = [ch.hex(" ").upper() for ch in chunks]
+            bin_groups = [" ".join(map(BIN8.__getitem__, ch)) for ch in chunks]
             text_groups = ["".join(bytes_to_ascii_runs(ch)) for ch in chunks] 
             self.str_groups_grid.set_values([hex_groups, bin_groups, text_groups])
 
         except Exception as exc:
-            self.str_error_var.set(str(exc))
+            self._last_update_key = None
+            _set_if_changed(self.str_error_var, str(exc))
             self.str_text_byte_btns.set_values([])
 
 
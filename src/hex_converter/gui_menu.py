@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import platform
+import sys
 import tkinter as tk
-import tkinter.messagebox as mbox
+from functools import lru_cache, partial
 
 
 # Declarative menu spec.
@@ -66,12 +66,52 @@ MENU_SPEC = [
     },
 ]
 
+# Named key tokens -> (menu label, Tk keysym)
+_KEYSYM_MAP = {
+    "ENTER":  ("Enter",  "Return"),
+    "RETURN": ("Return", "Return"),
+    "ESC":    ("Esc",    "Escape"),
+    "ESCAPE": ("Escape", "Escape"),
+    "SPACE":  ("Space",  "space"),
+    "TAB":    ("Tab",    "Tab"),
+    "BACKSPACE": ("Backspace", "BackSpace"),
+    "DELETE": ("Delete", "Delete"),
+    "HOME":   ("Home",   "Home"),
+    "END":    ("End",    "End"),
+    "PGUP":   ("PgUp",   "Prior"),
+    "PGDN":   ("PgDn",   "Next"),
+    "UP":     ("Up",     "Up"),
+    "DOWN":   ("Down",   "Down"),
+    "LEFT":   ("Left",   "Left"),
+    "RIGHT":  ("Right",  "Right"),
+    **{f"F{i}": (f"F{i}", f"F{i}") for i in range(1, 25)},
+    "COMMA":  (",", "comma"),
+    "PERIOD": (".", "period"),
+    "SLASH":  ("/", "slash"),
+    "SEMICOLON": (";", "semicolon"),
+    "QUOTE":  ("'", "quoteright"),
+    "BACKQUOTE": ("`", "grave"),
+    "MINUS":  ("-", "minus"),
+    "EQUAL":  ("=", "equal"),
+    "BACKSLASH": ("\\", "backslash"),
+    "BRACKETLEFT": ("[", "bracketleft"),
+    "BRACKETRIGHT": ("]", "bracketright"),
+}
+
+_MOD_TOKENS = frozenset({"MOD", "CTRL", "CMD", "ALT", "SHIFT"})
+
+# Modifier display/binding order: explicit CMD/CTRL (which drop MOD), else MOD
+_MOD_ORDER_EXPLICIT = ("CMD", "CTRL", "ALT", "SHIFT")
+_MOD_ORDER_MOD = ("MOD", "ALT", "SHIFT")
+
+@lru_cache(maxsize=1)
 def _platform_keycfg():
     """
     Platform-aware names for Tk bindings and user-facing labels.
     Also exposes explicit CTRL/CMD/ALT/SHIFT tokens in addition to MOD.
+    Cached (the platform can't change at runtime); treat the result as read-only.
     """
-    if platform.system() == "Darwin":
+    if sys.platform == "darwin":  # same test as platform.system() == "Darwin", without importing platform
         return {
             "MOD": "Command",     "MOD_LABEL": "Cmd",
             "CTRL": "Control",    "CTRL_LABEL": "Ctrl",
@@ -99,61 +139,19 @@ def _resolve_shortcut(shortcut: str, keycfg: dict[str, str]) -> tuple[str, str]:
     # Normalize once
     parts = [p.strip().upper() for p in shortcut.split("+") if p.strip()]
 
-    KEYSYM_MAP = {
-        "ENTER":  ("Enter",  "Return"),
-        "RETURN": ("Return", "Return"),
-        "ESC":    ("Esc",    "Escape"),
-        "ESCAPE": ("Escape", "Escape"),
-        "SPACE":  ("Space",  "space"),
-        "TAB":    ("Tab",    "Tab"),
-        "BACKSPACE": ("Backspace", "BackSpace"),
-        "DELETE": ("Delete", "Delete"),
-        "HOME":   ("Home",   "Home"),
-        "END":    ("End",    "End"),
-        "PGUP":   ("PgUp",   "Prior"),
-        "PGDN":   ("PgDn",   "Next"),
-        "UP":     ("Up",     "Up"),
-        "DOWN":   ("Down",   "Down"),
-        "LEFT":   ("Left",   "Left"),
-        "RIGHT":  ("Right",  "Right"),
-        **{f"F{i}": (f"F{i}", f"F{i}") for i in range(1, 25)},
-        "COMMA":  (",", "comma"),
-        "PERIOD": (".", "period"),
-        "SLASH":  ("/", "slash"),
-        "SEMICOLON": (";", "semicolon"),
-        "QUOTE":  ("'", "quoteright"),
-        "BACKQUOTE": ("`", "grave"),
-        "MINUS":  ("-", "minus"),
-        "EQUAL":  ("=", "equal"),
-        "BACKSLASH": ("\\", "backslash"),
-        "BRACKETLEFT": ("[", "bracketleft"),
-        "BRACKETRIGHT": ("]", "bracketright"),
-    }
-
-    MOD_TOKENS = {"MOD", "CTRL", "CMD", "ALT", "SHIFT"}
-
-    mods: list[str] = []
+    mods: set[str] = set()  # a set de-duplicates; the order tuples below fix the output order
     key_token: str | None = None
     for up in parts:
-        if up in MOD_TOKENS:
-            mods.append(up)
+        if up in _MOD_TOKENS:
+            mods.add(up)
         else:
             key_token = up  # last non-mod wins
 
-    # Drop MOD if CMD/CTRL present
-    has_cmdctrl = ("CMD" in mods) or ("CTRL" in mods)
-    if has_cmdctrl and "MOD" in mods:
-        mods = [m for m in mods if m != "MOD"]
-
-    # De-duplicate modifiers (order-preserving)
-    seen = set()
-    mods = [m for m in mods if not (m in seen or seen.add(m))]
-
-    # Order: if CMD/CTRL present -> CMD, CTRL, ALT, SHIFT; else -> MOD, ALT, SHIFT
-    ORDER = ["CMD", "CTRL", "ALT", "SHIFT"] if has_cmdctrl else ["MOD", "ALT", "SHIFT"]
+    # CMD/CTRL present -> CMD, CTRL, ALT, SHIFT (MOD dropped); else -> MOD, ALT, SHIFT
+    order = _MOD_ORDER_EXPLICIT if ("CMD" in mods or "CTRL" in mods) else _MOD_ORDER_MOD
 
     label_parts, bind_parts = [], []
-    for m in ORDER:
+    for m in order:
         if m in mods:
             label_parts.append(keycfg.get(f"{m}_LABEL", m.title()))
             bind_parts.append(keycfg.get(m, m.title()))
@@ -163,8 +161,8 @@ def _resolve_shortcut(shortcut: str, keycfg: dict[str, str]) -> tuple[str, str]:
         bind = "<" + "-".join(bind_parts) + ">" if bind_parts else ""
         return label, bind
 
-    if key_token in KEYSYM_MAP:
-        nice_label, keysym = KEYSYM_MAP[key_token]
+    if key_token in _KEYSYM_MAP:
+        nice_label, keysym = _KEYSYM_MAP[key_token]
         label_parts.append(nice_label)
         bind_parts.append(keysym)
     else:
@@ -179,85 +177,119 @@ def _resolve_shortcut(shortcut: str, keycfg: dict[str, str]) -> tuple[str, str]:
     bind = "<" + "-".join(bind_parts) + ">"
     return label, bind
 
+@lru_cache(maxsize=256)
+def _resolve_platform_shortcut(shortcut: str) -> tuple[str, str]:
+    """`_resolve_shortcut` for the current platform's keycfg, memoized per shortcut string."""
+    return _resolve_shortcut(shortcut, _platform_keycfg())
+
+def _bind_variants(bind_seq: str) -> tuple[str, ...]:
+    """`bind_seq` plus lower/upper-case key variants, robust to Caps Lock / Shift letter case."""
+    variants = {bind_seq}
+    try:
+        # Extract and edit only the final keysym
+        inner = bind_seq[1:-1]              # strip < >
+        parts = inner.split("-")            # e.g. ["Command", "Shift", "s"]
+        key = parts[-1]
+
+        if len(key) == 1 and key.isalpha():
+            # lower-case variant
+            parts_lower = parts[:]
+            parts_lower[-1] = key.lower()
+            variants.add("<" + "-".join(parts_lower) + ">")
+
+            # upper-case variant
+            parts_upper = parts[:]
+            parts_upper[-1] = key.upper()
+            variants.add("<" + "-".join(parts_upper) + ">")
+    except Exception:
+        pass
+    return tuple(variants)
+
+def _compile_menu_spec(spec: list[dict]) -> tuple:
+    """
+    Resolve `spec` into (menu_label, items) tuples, where each item is None for a
+    separator or (label, cmd_name, cmd_args, cmd_kwargs, accel_label, bind_variants).
+    """
+    menus = []
+    for menu_def in spec:
+        items = []
+        for item in menu_def.get("items", []):
+            if item.get("type") == "separator":
+                items.append(None)
+                continue
+
+            # Shortcut(s)
+            accel_for_menu = ""
+            variants: list[str] = []
+            sc = item.get("shortcut")
+            shortcuts = sc if isinstance(sc, (list, tuple)) else ([sc] if sc else [])
+
+            for idx, s in enumerate(shortcuts):
+                accel_label, bind_seq = _resolve_platform_shortcut(s)
+                if idx == 0:
+                    accel_for_menu = accel_label
+                if bind_seq:
+                    variants.extend(_bind_variants(bind_seq))
+
+            items.append((
+                item["label"],
+                item["command"],
+                tuple(item.get("command_args", [])),
+                dict(item.get("command_kwargs", {})),
+                accel_for_menu,
+                tuple(variants),
+            ))
+        menus.append((menu_def["menu"], tuple(items)))
+    return tuple(menus)
+
+@lru_cache(maxsize=1)
+def _compiled_default_spec() -> tuple:
+    """`MENU_SPEC`, compiled once for the current platform."""
+    return _compile_menu_spec(MENU_SPEC)
+
+def _break_after(invoke):
+    """Tk event handler that calls the menu wrapper, then stops further bindings."""
+    return lambda e: (invoke(), "break")
+
 def build_menubar(root: tk.Tk, app: object, spec: list[dict] = MENU_SPEC) -> tk.Menu:
     """
     Create and attach a menubar to `root` using `spec`, binding shortcuts to methods on `app`.
     Returns the created menubar.
     """
-    keycfg = _platform_keycfg()
+    compiled = _compiled_default_spec() if spec is MENU_SPEC else _compile_menu_spec(spec)
     menubar = tk.Menu(root)
     root.config(menu=menubar)
 
-    for menu_def in spec:
+    # Tk binding sequence -> menu callback, resolved once for the whole spec
+    accelerators: dict[str, object] = {}
+
+    for menu_label, items in compiled:
         m = tk.Menu(menubar, tearoff=False)
-        menubar.add_cascade(label=menu_def["menu"], menu=m)
+        menubar.add_cascade(label=menu_label, menu=m)
 
-        for item in menu_def.get("items", []):
-            if item.get("type") == "separator":
+        for item in items:
+            if item is None:
                 m.add_separator()
                 continue
 
-            label = item["label"]
-            cmd_name = item["command"]
+            label, cmd_name, cmd_args, cmd_kwargs, accel_label, variants = item
             command = getattr(app, cmd_name, None) or (lambda *a, **k: None)
-            cmd_args = item.get("command_args", [])
-            cmd_kwargs = item.get("command_kwargs", {})
+            invoke = partial(command, *cmd_args, **cmd_kwargs)
 
-            def invoke(fn=command, args=cmd_args, kwargs=cmd_kwargs):
-                fn(*args, **kwargs)
+            for v in variants:
+                accelerators[v] = invoke  # later items win, as with rebinding
 
-            # Shortcut(s)
-            accel_for_menu = ""
-            sc = item.get("shortcut")
-            shortcuts = sc if isinstance(sc, (list, tuple)) else ([sc] if sc else [])
-            seen_bindings = set()
+            m.add_command(label=label, command=invoke, accelerator=accel_label)
 
-            for idx, s in enumerate(shortcuts):
-                accel_label, bind_seq = _resolve_shortcut(s, keycfg)
-                if idx == 0:
-                    accel_for_menu = accel_label
-                if not bind_seq:
-                    continue
-
-                # Collect variants to be robust to Caps Lock / Shift letter case
-                variants = {bind_seq}
-                try:
-                    # Extract and edit only the final keysym
-                    inner = bind_seq[1:-1]              # strip < >
-                    parts = inner.split("-")            # e.g. ["Command", "Shift", "s"]
-                    key = parts[-1]
-
-                    if len(key) == 1 and key.isalpha():
-                        # lower-case variant
-                        parts_lower = parts[:]
-                        parts_lower[-1] = key.lower()
-                        v_lower = "<" + "-".join(parts_lower) + ">"
-                        variants.add(v_lower)
-
-                        # upper-case variant
-                        parts_upper = parts[:]
-                        parts_upper[-1] = key.upper()
-                        v_upper = "<" + "-".join(parts_upper) + ">"
-                        variants.add(v_upper)
-                except Exception:
-                    pass
-
-                for v in variants:
-                    if v in seen_bindings:
-                        continue
-                    seen_bindings.add(v)
-                    try:
-                        root.unbind_all(v)
-                    except Exception:
-                        pass
-                    # IMPORTANT: call the wrapper with args/kwargs
-                    root.bind_all(v, lambda e, inv=invoke: (inv(), "break"))
-
-            m.add_command(label=label, command=invoke, accelerator=accel_for_menu)
+    # bind_all (without a "+" prefix) replaces any previous binding, so no unbind_all first
+    for seq, invoke in accelerators.items():
+        root.bind_all(seq, _break_after(invoke))
 
     return menubar
 
 def show_about_dialog(app, root):
+    from tkinter import messagebox as mbox  # dialog-only; kept off the startup path
+
     mbox.showinfo(
         "About Hex Converter",
         "Hex Bytes ⇆ Integer/Text Converter\n"
@@ -265,11 +297,9 @@ def show_about_dialog(app, root):
         "© 2025 Wired Square"
     )
 
-def show_shortcuts_dialog(app, root):
-    """
-    Show a popup with the list of shortcuts from MENU_SPEC.
-    """
-    keycfg = _platform_keycfg()
+@lru_cache(maxsize=1)
+def _shortcuts_text() -> str:
+    """The shortcuts listing for MENU_SPEC (static for the process, so built once)."""
     lines = []
     for menu in MENU_SPEC:
         for item in menu.get("items", []):
@@ -282,9 +312,16 @@ def show_shortcuts_dialog(app, root):
 
             shortcuts = shortcut if isinstance(shortcut, (list, tuple)) else [shortcut]
             shortcut_labels = [
-                _resolve_shortcut(s, keycfg)[0]
+                _resolve_platform_shortcut(s)[0]
                 for s in shortcuts
             ]
             lines.append(f"{label}: {', '.join(shortcut_labels)}")
+    return "\n".join(lines)
+
+def show_shortcuts_dialog(app, root):
+    """
+    Show a popup with the list of shortcuts from MENU_SPEC.
+    """
+    from tkinter import messagebox as mbox
 
-    mbox.showinfo("Keyboard Shortcuts", "\n".join(lines), parent=root)
+    mbox.showinfo("Keyboard Shortcuts", _shortcuts_text(), parent=root)
@@ -3,19 +3,45 @@
 from __future__ import annotations
 
 import re
+import struct
+from functools import lru_cache
+from itertools import accumulate
 from typing import Iterable, List, Tuple
 
 MAX_BYTES = 8
 PRINTABLE_MIN = 32
 PRINTABLE_MAX = 126
 
+# Per-byte display strings, indexed by byte value
+BIN8 = tuple(f"{i:08b}" for i in range(256))
+HEX2 = tuple(f"{i:02X}" for i in range(256))
+
+__all__ = [
+    "MAX_BYTES", "PRINTABLE_MIN", "PRINTABLE_MAX", "BIN8", "HEX2",
+    "bytes_to_ascii_runs", "bytes_to_int",
+    "bytes_to_ones_complement", "bytes_to_sign_magnitude",
+    "parse_hex_bytes", "parse_groups_pattern", "parse_int_maybe",
+    "int_range_for", "range_for_mode", "int_to_bytes",
+    "group_bytes_by_sizes", "group_bytes_into_hex", "group_bytes_into_hex_custom",
+    "group_bytes_to_ints", "int_to_ones_complement", "int_to_sign_magnitude",
+]
+
 
 # ---------------- Value logic ----------------
 def parse_groups_pattern(text: str) -> list[int]:
+    return list(_parse_groups_pattern(text))
+
+@lru_cache(maxsize=256)
+def _parse_groups_pattern(text: str) -> tuple[int, ...]:
+    # Cached as a tuple so callers can't mutate a shared result
     s = (text or "").replace(",", " ")
     parts = [p for p in s.split() if p.strip()]
-    return [int(p) for p in parts if int(p) > 0]
+    return tuple(int(p) for p in parts if int(p) > 0)
 
+_RE_0X = re.compile(r"0x", re.IGNORECASE)
+_RE_HEXBYTE = re.compile(r"[0-9A-Fa-f]{2}")
+
+@lru_cache(maxsize=256)
 def parse_hex_bytes(text: str) -> bytes:
     """Parse a string of hex into up to ``MAX_BYTES`` bytes.
 
@@ -26,38 +52,68 @@ def parse_hex_bytes(text: str) -> bytes:
       - "E808B00400002C01" (continuous)
       - Single nibbles allowed when separated ("F" → "0F")
     """
+    data = _parse_hex_fast(text)
+    return data if data is not None else _parse_hex_tokens(text)
+
+def _parse_hex_fast(text: str) -> bytes | None:
+    """
+    ``bytes.fromhex`` fast path for ``parse_hex_bytes``. Returns None whenever
+    the token parser has to decide (0x/_ prefixes, single nibbles, tokens that
+    are not exactly one byte, too many bytes, or invalid input).
+    """
+    # Same normalization order as _parse_hex_tokens (strip, then commas → spaces)
+    s = text.strip().replace(",", " ")
+    try:
+        data = bytes.fromhex(s)
+    except ValueError:
+        return None
+    tokens = s.split()
+    # Separated input: every token must have been exactly one byte
+    if tokens != [s] and len(data) != len(tokens):
+        return None
+    if len(data) > MAX_BYTES:
+        return None
+    return data
+
+def _parse_hex_tokens(text: str) -> bytes:
     s = text.strip()
     if not s:
         return b""
 
-    s = s.replace(",", " ")
-    s = re.sub(r"0x", "", s, flags=re.IGNORECASE)
-    s = s.replace("_", " ")
-    s = re.sub(r"\s+", " ", s)
-
-    if " " in s:
-        tokens = s.split(" ")
-    else:
+    # Only normalize what is actually present (clean input skips it all)
+    if "," in s:
+        s = s.replace(",", " ")
+    if "0x" in s or "0X" in s:
+        s = _RE_0X.sub("", s)
+    if "_" in s:
+        s = s.replace("_", " ")
+
+    # Any whitespace separates tokens; a single token is continuous hex
+    tokens = s.split()
+    if tokens == [s]:
         if len(s) % 2 != 0:
             raise ValueError(
                 "Continuous hex string must have an even number of characters."
             )
         tokens = [s[i : i + 2] for i in range(0, len(s), 2)]
 
-    out: list[int] = []
-    for tok in tokens:
-        if not tok:
-            continue
-        if len(tok) == 1:
-            tok = "0" + tok
-        if not re.fullmatch(r"[0-9A-Fa-f]{2}", tok):
-            raise ValueError(f"Invalid hex byte: {tok}")
-        out.append(int(tok, 16))
+    # Pad single nibbles, then decode every token with one bytes.fromhex call
+    tokens = ["0" + tok if len(tok) == 1 else tok for tok in tokens]
+    joined = "".join(tokens)
+    out = None
+    if len(joined) == 2 * len(tokens):  # every token is exactly one byte
+        try:
+            out = bytes.fromhex(joined)
+        except ValueError:
+            pass
+    if out is None:
+        bad = next(tok for tok in tokens if not _RE_HEXBYTE.fullmatch(tok))
+        raise ValueError(f"Invalid hex byte: {bad}")
 
     if len(out) > MAX_BYTES:
         raise ValueError(f"More than {MAX_BYTES} bytes provided.")
 
-    return bytes(out)
+    return out
 
 def parse_int_maybe(text: str) -> int:
     """Parse an integer accepting 0x/0b/0o prefixes or decimal."""
@@ -66,6 +122,7 @@ def parse_int_maybe(text: str) -> int:
         raise ValueError("Enter a number (e.g., 1234 or 0x4D2).")
     return int(s, 0)
 
+@lru_cache(maxsize=32)
 def int_range_for(width: int, signed: bool) -> Tuple[int, int]:
     """
     Return inclusive (lo, hi) range for a given byte width and signedness.
@@ -90,23 +147,26 @@ def int_range_for(width: int, signed: bool) -> Tuple[int, int]:
 # ---------------- Byte grouping ----------------
 def chunk_bytes(data: bytes, group_mode: str, custom_pattern: str, endian: str) -> list[bytes]:
     if group_mode == "custom":
-        sizes = parse_groups_pattern(custom_pattern)
-        chunks: list[bytes] = []
-        i = 0
-        for sz in sizes:
-            if i >= len(data):
-                break
-            chunks.append(data[i:i+sz])
-            i += sz
-        if i < len(data):
-            chunks.append(data[i:])
+        # group_bytes_by_sizes only reads the cached tuple
+        chunks = group_bytes_by_sizes(data, _parse_groups_pattern(custom_pattern))
     else:
         g = int(group_mode) if group_mode in {"1","2","4","8"} else 1
         chunks = [data[i:i+g] for i in range(0, len(data), g)]
     if endian == "little":
-        chunks = [bytes(reversed(ch)) for ch in chunks]
+        chunks = [ch[::-1] for ch in chunks]
     return chunks
 
+# (unsigned, signed) struct format characters keyed by group size
+_STRUCT_CODES = {1: ("B", "b"), 2: ("H", "h"), 4: ("I", "i"), 8: ("Q", "q")}
+
+# Precompiled single-value packers keyed by (endian, width, signed); other widths use to_bytes
+_INT_STRUCTS = {
+    (endian, size, signed): struct.Struct(order + code)
+    for endian, order in (("big", ">"), ("little", "<"))
+    for size, codes in _STRUCT_CODES.items()
+    for signed, code in zip((False, True), codes)
+}
+
 def group_bytes_to_ints(
     data: bytes, *, endian: str, group_size: int
 ) -> tuple[list[int], list[int]]:
@@ -122,16 +182,18 @@ def group_bytes_to_ints(
     if group_size not in (1, 2, 4, 8):
         raise ValueError("group_size must be one of {1, 2, 4, 8}")
 
-    # Group without reordering the whole stream
-    chunks = [data[i:i + group_size] for i in range(0, len(data), group_size)]
-
-    u_vals: list[int] = []
-    s_vals: list[int] = []
-    for ch in chunks:
-        if not ch:
-            continue
-        u_vals.append(int.from_bytes(ch, byteorder=endian, signed=False))
-        s_vals.append(int.from_bytes(ch, byteorder=endian, signed=True))
+    # Whole groups in bulk: one unpack per signedness, struct handles byte order
+    count, rem = divmod(len(data), group_size)
+    u_code, s_code = _STRUCT_CODES[group_size]
+    order = "<" if endian == "little" else ">"
+    u_vals = list(struct.unpack_from(f"{order}{count}{u_code}", data))
+    s_vals = list(struct.unpack_from(f"{order}{count}{s_code}", data))
+
+    # A shorter trailing group falls back to int.from_bytes
+    if rem:
+        tail = data[len(data) - rem:]
+        u_vals.append(int.from_bytes(tail, byteorder=endian, signed=False))
+        s_vals.append(int.from_bytes(tail, byteorder=endian, signed=True))
     return u_vals, s_vals
 
 def group_bytes_by_sizes(data: bytes, sizes: List[int]) -> list[bytes]:
@@ -140,29 +202,24 @@ def group_bytes_by_sizes(data: bytes, sizes: List[int]) -> list[bytes]:
     - Ignores non-positive sizes.
     - Stops when input is exhausted.
     """
-    out: list[bytes] = []
-    i = 0
-    for sz in sizes:
-        if sz <= 0:
-            continue
-        if i >= len(data):
-            break
-        out.append(data[i:i+sz])
-        i += sz
-    if i < len(data) and sizes:
+    offsets = list(accumulate((sz for sz in sizes if sz > 0), initial=0))
+    n = len(data)
+    out = [data[a:b] for a, b in zip(offsets, offsets[1:]) if a < n]
+    if offsets[-1] < n:
         # If sizes don't cover all data, put the remaining bytes as one last group
-        out.append(data[i:])
-    elif not sizes:
-        out = [data] if data else []
+        out.append(data[offsets[-1]:])
     return out
 
 def group_bytes_into_hex(data: bytes, group_size: int, endian: str) -> list[str]:
     if group_size not in (1, 2, 4, 8):
         return []
-    chunks = [data[i:i+group_size] for i in range(0, len(data), group_size)]
-    if endian == "little":
-        chunks = [ch[::-1] for ch in chunks]
-    return [" ".join(f"{b:02X}" for b in ch) for ch in chunks]
+    if endian != "little":
+        # One hex call for the whole buffer, sliced at group boundaries ("XX " per byte)
+        hs = data.hex(" ").upper()
+        stride = group_size * 3
+        return [hs[i:i + stride - 1] for i in range(0, len(hs), stride)]
+    chunks = [data[i:i+group_size][::-1] for i in range(0, len(data), group_size)]
+    return [ch.hex(" ").upper() for ch in chunks]
 
 def group_bytes_into_hex_custom(data: bytes, sizes: List[int], endian: str) -> list[str]:
     """
@@ -172,92 +229,114 @@ def group_bytes_into_hex_custom(data: bytes, sizes: List[int], endian: str) -> l
     chunks = group_bytes_by_sizes(data, sizes)
     if endian == "little":
         chunks = [ch[::-1] for ch in chunks]
-    return [" ".join(f"{b:02X}" for b in ch) for ch in chunks]
+    return [ch.hex(" ").upper() for ch in chunks]
 
 
 # ---------------- Value logic ----------------
+# Printable bytes, and a regex splitting latin-1 text into printable / non-printable segments
+_PRINTABLE_BYTES = bytes(range(PRINTABLE_MIN, PRINTABLE_MAX + 1))
+_PRINTABLE_CLASS = f"\\x{PRINTABLE_MIN:02x}-\\x{PRINTABLE_MAX:02x}"
+_ASCII_SEGMENTS = re.compile(f"[{_PRINTABLE_CLASS}]+|[^{_PRINTABLE_CLASS}]+")
+
 def bytes_to_ascii_runs(data: Iterable[int]) -> list[str]:
     """Group printable ASCII into strings; map non-printables to '.'.
     Coalesces contiguous non-printables into a single dot *except* 0x7F (DEL),
     which is always emitted as its own '.' to match tests.
     """
-    runs: list[str] = []
-    buf: list[str] = []
+    raw = data if isinstance(data, bytes) else bytes(data)
+    text = raw.decode("latin-1")
+    if not raw.translate(None, _PRINTABLE_BYTES):
+        # All printable (the common case): a single run
+        return [text] if text else []
 
-    def flush_buf():
-        if buf:
-            runs.append("".join(buf))
-            buf.clear()
-
-    for b in data:
-        if PRINTABLE_MIN <= b <= PRINTABLE_MAX:
-            buf.append(chr(b))
+    runs: list[str] = []
+    for seg in _ASCII_SEGMENTS.findall(text):
+        if PRINTABLE_MIN <= ord(seg[0]) <= PRINTABLE_MAX:
+            runs.append(seg)
             continue
-
-        # non-printable
-        flush_buf()
-        if b == 0x7F:
-            # DEL is always its own dot, even if previous was also a dot
+        # non-printable: generic bytes coalesce into one dot (none if the
+        # previous run is already "."), while every DEL is always its own dot
+        if seg[0] != "\x7f" and (not runs or runs[-1] != "."):
             runs.append(".")
-        else:
-            # coalesce generic non-printables
-            if not runs or runs[-1] != ".":
-                runs.append(".")
-
-    flush_buf()
+        runs.extend(["."] * seg.count("\x7f"))
     return runs
 
+def range_for_mode(width: int, mode: str) -> Tuple[int, int]:
+    """Inclusive (lo, hi) accepted by int_to_bytes for representation `mode`."""
+    if mode == "Unsigned":
+        return int_range_for(width, signed=False)
+    if mode == "Signed (2's complement)":
+        return int_range_for(width, signed=True)
+    if mode in ("Signed (1's complement)", "Signed (Sign-magnitude)"):
+        # No representable -2^(n-1): one less magnitude on the negative side
+        lo, hi = int_range_for(width, signed=True)
+        return lo + 1, hi
+    raise ValueError(f"Unknown representation mode: {mode}")
+
 def int_to_bytes(val: int, width: int, mode: str, endian: str) -> bytes:
     """Convert integer to bytes according to representation."""
     if mode == "Unsigned":
-        if val < 0 or val >= 1 << (width * 8):
+        lo, hi = range_for_mode(width, mode)
+        if not (lo <= val <= hi):
             raise ValueError(f"Value out of range for {width}-byte unsigned")
+        packer = _INT_STRUCTS.get((endian, width, False))
+        if packer is not None:
+            return packer.pack(val)
         return val.to_bytes(width, byteorder=endian, signed=False)
 
     elif mode == "Signed (2's complement)":
-        min_val, max_val = -(1 << (width*8 - 1)), (1 << (width*8 - 1)) - 1
-        if not (min_val <= val <= max_val):
+        lo, hi = range_for_mode(width, mode)
+        if not (lo <= val <= hi):
             raise ValueError(f"Value out of range for {width}-byte 2's complement")
+        packer = _INT_STRUCTS.get((endian, width, True))
+        if packer is not None:
+            return packer.pack(val)
         return val.to_bytes(width, byteorder=endian, signed=True)
 
     elif mode == "Signed (1's complement)":
         # Range: −(2^(n−1)−1) .. +(2^(n−1)−1); no representable −2^(n−1)
-        max_mag = (1 << (8*width - 1)) - 1
-        if not (-max_mag <= val <= max_mag):
+        lo, hi = range_for_mode(width, mode)
+        if not (lo <= val <= hi):
             raise ValueError(f"Value out of range for {width}-byte 1's complement")
         if val >= 0:
             return val.to_bytes(width, byteorder=endian, signed=False)
-        # negative: bitwise NOT of the magnitude
-        mag = (-val).to_bytes(width, byteorder=endian, signed=False)
-        return bytes((~x) & 0xFF for x in mag)
+        # negative: bitwise NOT of the magnitude (XOR with the all-ones mask)
+        mask = (1 << (8*width)) - 1
+        return ((-val) ^ mask).to_bytes(width, byteorder=endian, signed=False)
 
     elif mode == "Signed (Sign-magnitude)":
         # Range: −(2^(n−1)−1) .. +(2^(n−1)−1); the top bit is the sign bit.
-        magnitude = abs(val)
-        if magnitude >= 1 << (width*8 - 1):
+        lo, hi = range_for_mode(width, mode)
+        if not (lo <= val <= hi):
             raise ValueError("Value out of range for sign-magnitude")
-        data = magnitude.to_bytes(width, byteorder=endian, signed=False)
-        if val < 0:
-            if endian == "big":
-                data = bytes([data[0] | 0x80]) + data[1:]
-            else:
-                data = data[:-1] + bytes([data[-1] | 0x80])
-        return data
+        # Endian-agnostic: set the sign bit (hi + 1) on the full-width int, then encode once
+        raw = -val | (hi + 1) if val < 0 else val
+        return raw.to_bytes(width, byteorder=endian, signed=False)
 
     else:
         raise ValueError(f"Unknown representation mode: {mode}")
 
+def _unpack_unsigned(b: bytes, endian: str) -> int:
+    """Full-width unsigned value of `b`, via a precompiled struct for 1/2/4/8 bytes."""
+    unpacker = _INT_STRUCTS.get((endian, len(b), False))
+    if unpacker is not None:
+        return unpacker.unpack(b)[0]
+    return int.from_bytes(b, byteorder=endian, signed=False)
+
 def bytes_to_int(b: bytes, mode: str, endian: str) -> int:
     """Convert bytes to integer according to representation."""
     if mode == "Unsigned":
-        return int.from_bytes(b, byteorder=endian, signed=False)
+        return _unpack_unsigned(b, endian)
 
     elif mode == "Signed (2's complement)":
+        unpacker = _INT_STRUCTS.get((endian, len(b), True))
+        if unpacker is not None:
+            return unpacker.unpack(b)[0]
         return int.from_bytes(b, byteorder=endian, signed=True)
 
     elif mode == "Signed (1's complement)":
         # Endian-agnostic: operate on the full-width unsigned int.
-        u = int.from_bytes(b, byteorder=endian, signed=False)
+        u = _unpack_unsigned(b, endian)
         mask = (1 << (8*len(b))) - 1
         sign_bit = 1 << (8*len(b) - 1)
         if u & sign_bit:
@@ -267,14 +346,10 @@ def bytes_to_int(b: bytes, mode: str, endian: str) -> int:
         return u
 
     elif mode == "Signed (Sign-magnitude)":
-        if endian == "big":
-            sign = b[0] & 0x80
-            mag_bytes = bytes([b[0] & 0x7F]) + b[1:]
-        else:
-            sign = b[-1] & 0x80
-            mag_bytes = b[:-1] + bytes([b[-1] & 0x7F])
-        magnitude = int.from_bytes(mag_bytes, byteorder=endian, signed=False)
-        return -magnitude if sign else magnitude
+        # Endian-agnostic: the sign bit is the top bit of the full-width unsigned int
+        u = _unpack_unsigned(b, endian)
+        sign_bit = 1 << (8*len(b) - 1)
+        return -(u ^ sign_bit) if u & sign_bit else u
 
     else:
         raise ValueError(f"Unknown representation mode: {mode}")
@@ -292,11 +367,10 @@ def chunks_to_unsigned_signed(chunks: list[bytes]) -> tuple[list[int], list[int]
 # ---------------- Signed representations ----------------
 def bytes_to_ones_complement(b: bytes) -> int:
     """Interpret bytes as signed 1's complement integer."""
-    first_bit = b[0] & 0x80
-    if first_bit:
-        inv = bytes(~x & 0xFF for x in b)
-        return -int.from_bytes(inv, "big")
-    return int.from_bytes(b, "big")
+    u = int.from_bytes(b, "big")
+    if b[0] & 0x80:
+        return -(u ^ ((1 << (8*len(b))) - 1))
+    return u
 
 def bytes_to_sign_magnitude(b: bytes) -> int:
     """Interpret bytes as signed sign-magnitude integer."""
@@ -307,11 +381,9 @@ def bytes_to_sign_magnitude(b: bytes) -> int:
 
 def int_to_ones_complement(val: int, width: int, endian: str) -> bytes:
     if val < 0:
-        data = abs(val).to_bytes(width, byteorder=endian)
-        data = bytes(~b & 0xFF for b in data)
-    else:
-        data = val.to_bytes(width, byteorder=endian)
-    return data
+        # A magnitude wider than `width` keeps its high bits, so to_bytes still overflows
+        return (-val ^ ((1 << (8*width)) - 1)).to_bytes(width, byteorder=endian)
+    return val.to_bytes(width, byteorder=endian)
 
 def int_to_sign_magnitude(val: int, width: int, endian: str) -> bytes:
     sign = (val < 0)
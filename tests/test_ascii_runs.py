@@ -9,6 +9,10 @@ from hex_converter.logic import bytes_to_ascii_runs
         (b"\x00A\x00\x7F", [".", "A", ".", "."]),
         (b"Hello, CAN!", ["Hello, CAN!"]),
         (b"\x10\x11Test\x12", [".", "Test", "."]),
+        (b"", []),
+        (b"\x7F\x7F", [".", "."]),
+        (b"\x00\x00\x7F\x00", [".", "."]),
+        (b"caf\xE9", ["caf", "."]),
     ]
 )
 def test_ascii_runs(data, expected):
@@ -0,0 +1,69 @@
+import io
+
+import pytest
+from hex_converter.cli import build_parser, cmd_number, main
+
+
+def _run(capsys, argv: list[str]) -> dict[str, str]:
+    assert main(argv) == 0
+    out = capsys.readouterr().out
+    return dict(line.split(": ", 1) for line in out.splitlines())
+
+
+@pytest.mark.parametrize(
+    "argv,key,expected",
+    [
+        (["hex", "e8 08 b0 04"], "Bytes", "E8 08 B0 04"),
+        (["hex", "e808b004", "--group", "2", "--endian", "big"], "Hex groups", "E8 08 B0 04"),
+        (["hex", "e808b004", "--group", "2"], "Hex groups", "08 E8 04 B0"),
+        (["number", "0xE808B004", "--endian", "big"], "Bytes", "E8 08 B0 04"),
+        (["number", "0xE808B004"], "Bytes", "04 B0 08 E8"),
+        (["string", "Hi!"], "Bytes", "48 69 21"),
+        (["string", "Hi!", "--group", "2", "--endian", "big"], "Hex groups", "48 69 21"),
+        (["hex", "48 69 21"], "ASCII", "Hi!"),
+        (["hex", "41 00 00 42 7F"], "ASCII", "A.B."),
+    ],
+)
+def test_cli_hex_output(capsys, argv, key, expected):
+    assert _run(capsys, argv)[key] == expected
+
+
+@pytest.mark.parametrize(
+    "group,endian,expect_unsigned,expect_signed",
+    [
+        ("1", "little", "232 8 176", "-24 8 -80"),
+        ("2", "little", "2280 176", "2280 -80"),
+        ("2", "big", "59400 176", "-6136 -80"),
+        ("4", "little", "11536616", "-5240600"),
+        ("4", "big", "15206576", "-1570640"),
+    ],
+)
+def test_cli_hex_group_ints(capsys, group, endian, expect_unsigned, expect_signed):
+    out = _run(capsys, ["hex", "E8 08 B0", "--group", group, "--endian", endian])
+    assert out["Unsigned"] == expect_unsigned
+    assert out["Signed 2's"] == expect_signed
+
+
+def test_cli_hex_reads_piped_stdin(capsys, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(b"E8 08\r\nB0 04\n")))
+    assert _run(capsys, ["hex"])["Bytes"] == "E8 08 B0 04"
+
+
+def test_cli_hex_stdin_uses_stdin_encoding(capsys, monkeypatch):
+    # U+3000 (ideographic space) is whitespace only when decoded as UTF-8
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO("E8\u300008\n".encode()), encoding="utf-8"))
+    assert _run(capsys, ["hex"])["Bytes"] == "E8 08"
+
+
+@pytest.mark.parametrize("bad", ["E808 B004", "0f03,", "11 22 33 44 55 66 77 88 99"])
+def test_cli_hex_rejects_what_parser_rejects(bad):
+    with pytest.raises(ValueError):
+        main(["hex", bad])
+
+
+def test_cli_command_writes_its_own_output(capsys):
+    args = build_parser().parse_args(["number", "0x41", "--width", "1"])
+    assert cmd_number(args) == 0
+    assert "Bytes: 41\n" in capsys.readouterr().out
+    assert cmd_number(args) == 0
+    assert capsys.readouterr().out.count("Bytes: ") == 1
@@ -13,7 +13,7 @@ def _chunks_after_group_then_endian(data: bytes, sizes: list[int], endian: str)
     if i < len(data):
         chunks.append(data[i:])
     if endian == "little":
-        chunks = [bytes(reversed(ch)) for ch in chunks]
+        chunks = [ch[::-1] for ch in chunks]
     return chunks
 
 def test_group_bytes_into_hex_custom_big_endian_basic(logic):
@@ -75,3 +75,8 @@ def test_custom_group_decimals_match_endian_chunks(logic, data, sizes, endian, e
     s = [int.from_bytes(ch, byteorder="big", signed=True) for ch in chunks]
     assert u == expect_unsigned
     assert s == expect_signed
+
+def test_parse_groups_pattern_returns_fresh_list(logic):
+    first = logic.parse_groups_pattern("1, 1 6")
+    first.append(99)
+    assert logic.parse_groups_pattern("1, 1 6") == [1, 1, 6]
@@ -37,3 +37,19 @@ def test_parse_int_maybe_negatives(logic, text, expected):
 def test_parse_int_maybe_errors(logic, bad):
     with pytest.raises(ValueError):
         logic.parse_int_maybe(bad)
+
+@pytest.mark.parametrize(
+    "mode,expect_lo,expect_hi",
+    [
+        ("Unsigned", 0, 65535),
+        ("Signed (2's complement)", -32768, 32767),
+        ("Signed (1's complement)", -32767, 32767),
+        ("Signed (Sign-magnitude)", -32767, 32767),
+    ],
+)
+def test_range_for_mode(logic, mode, expect_lo, expect_hi):
+    assert logic.range_for_mode(2, mode) == (expect_lo, expect_hi)
+
+def test_range_for_mode_unknown_mode(logic):
+    with pytest.raises(ValueError):
+        logic.range_for_mode(2, "1's complement")
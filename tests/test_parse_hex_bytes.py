@@ -18,3 +18,15 @@ def test_parse_hex_bytes_ok(logic, text, expected):
 def test_parse_hex_bytes_errors(logic, bad):
     with pytest.raises(ValueError):
         logic.parse_hex_bytes(bad)
+
+@pytest.mark.parametrize("text", ["", "E808B004", "E8 08 B0 04", "e8,08,b0", " E8\t08\n"])
+def test_parse_hex_fast_accepts_plain_bytes(logic, text):
+    fast = logic._parse_hex_fast(text)
+    assert fast is not None
+    assert fast == logic._parse_hex_tokens(text)
+
+@pytest.mark.parametrize(
+    "text", ["F A", "0xE8 0x08", "E808 B004", "0f03,", "E808B0040", "11 22 33 44 55 66 77 88 99"]
+)
+def test_parse_hex_fast_declines_to_token_parser(logic, text):
+    assert logic._parse_hex_fast(text) is None